@@ -0,0 +1,64 @@
+# Copyright 2025 Sreenath Somarajapuram
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+# benchmarks/bench_loads_many.py
+Compares the per-item cost of `loads_many` against one `loads` call per string.
+
+Usage:
+    python benchmarks/bench_loads_many.py
+"""
+
+import random
+import timeit
+
+from pyliteral import loads, loads_many
+
+
+BATCH_SIZE = 10_000
+REPEAT = 5
+
+VARS = {"region": "us-east-1"}
+
+
+def _column(distinct: int):
+    """Build a batch of tiny literals with exactly `distinct` unique values."""
+    rng = random.Random(0)
+    values = [
+        *(str(i) for i in range(distinct // 4)),
+        *(f'"user-{i}"' for i in range(distinct // 4)),
+        *(f"[{i}, {i + 1}]" for i in range(distinct // 4)),
+        *(f'f"{{region}}-{i}"' for i in range(distinct // 4)),
+    ]
+    # Every value appears at least once, the rest of the batch repeats them at random
+    column = values + [rng.choice(values) for _ in range(BATCH_SIZE - len(values))]
+    rng.shuffle(column)
+    return column
+
+
+def _per_item_us(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=REPEAT)) / BATCH_SIZE * 1e6
+
+
+def main():
+    print(f"{'distinct values':>16} {'loads (us)':>12} {'loads_many (us)':>16} {'speedup':>8}")
+    for distinct in (BATCH_SIZE, 1_000, 100):
+        strings = _column(distinct)
+        single = _per_item_us(lambda: [loads(s, vars=VARS) for s in strings])
+        batch = _per_item_us(lambda: loads_many(strings, vars=VARS))
+        print(f"{distinct:>16} {single:>12.2f} {batch:>16.2f} {single / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
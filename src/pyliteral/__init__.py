@@ -14,7 +14,8 @@
 
 from .load import load
 from .loads import loads
+from .loads_many import loads_many
 from .core.types import Object
 
 
-__all__ = ["load", "loads", "Object"]
+__all__ = ["load", "loads", "loads_many", "Object"]
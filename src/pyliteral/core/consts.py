@@ -13,3 +13,4 @@
 # limitations under the License.
 
 MAX_SIZE: int = 1024 * 1024  # 1 MB should be more than enough for most use cases
+MAX_CACHED_TREES: int = 1024  # Parsed trees kept per loads_many call
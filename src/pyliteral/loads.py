@@ -22,8 +22,8 @@ from pyliteral.core.consts import MAX_SIZE
 from pyliteral.literal_transformer import LiteralTransformer
 
 
-def loads(s: str, max_size: int = MAX_SIZE, vars: Dict[str, Object] = None) -> Object:
-    """ Parse a Python object from a literal string. """
+def _check_input(s: str, max_size: int) -> None:
+    """ Validate a literal string before it is parsed. """
 
     if not s:
         raise ValueError("Input string cannot be empty")
@@ -34,6 +34,12 @@ def loads(s: str, max_size: int = MAX_SIZE, vars: Dict[str, Object] = None) -> O
     if len(s) > max_size:
         raise MaxSizeExceededError(max_size)
 
+
+def loads(s: str, max_size: int = MAX_SIZE, vars: Dict[str, Object] = None) -> Object:
+    """ Parse a Python object from a literal string. """
+
+    _check_input(s, max_size)
+
     if vars is None:
         vars = {}
 
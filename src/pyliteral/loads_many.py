@@ -0,0 +1,83 @@
+# Copyright 2025 Sreenath Somarajapuram
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Union
+
+from pyliteral.core.types import Object
+from pyliteral.core.consts import MAX_SIZE, MAX_CACHED_TREES
+
+from pyliteral.literal_transformer import LiteralTransformer
+from pyliteral.loads import _check_input
+
+
+def loads_many(
+    strings: Iterable[str],
+    max_size: int = MAX_SIZE,
+    vars: Dict[str, Object] = None
+) -> List[Union[Object, Exception]]:
+    """
+    Parse a batch of literal strings in one call.
+
+    A single transformer is shared across the batch, and the trees of recently seen
+    strings are kept in an LRU cache of at most `MAX_CACHED_TREES` entries, so a
+    repeated string is parsed and transformed only once while memory stays bounded
+    for batches of mostly unique values. Repeated strings re-run `literal_eval` on
+    the cached tree, so every item still gets its own fresh containers. Failures are
+    never cached.
+
+    Args:
+        strings: An iterable of literal strings
+        max_size: Maximum allowed size of each string
+        vars: Variables available to every string in the batch
+
+    Returns:
+        A list with one entry per input string, in order. Items that failed to parse
+        hold their own exception instance, with its traceback cleared, instead of a
+        value, so one bad string does not fail the whole batch.
+
+    Raises:
+        TypeError: If `strings` is a single string instead of an iterable of strings
+    """
+    if isinstance(strings, str):
+        raise TypeError("Expected an iterable of strings, not a single string")
+
+    if vars is None:
+        vars = {}
+
+    transformer = LiteralTransformer(vars)
+    trees: "OrderedDict[str, ast.AST]" = OrderedDict()
+    results: List[Union[Object, Exception]] = []
+
+    for s in strings:
+        try:
+            _check_input(s, max_size)
+
+            tree = trees.get(s)
+            if tree is None:
+                tree = transformer.visit(ast.parse(s, mode="eval")).body
+                if len(trees) >= MAX_CACHED_TREES:
+                    trees.popitem(last=False)  # Evict the least recently used tree
+                trees[s] = tree
+            else:
+                trees.move_to_end(s)
+
+            results.append(ast.literal_eval(tree))
+        except Exception as exc:
+            # Drop the traceback, it would keep this frame and the cache alive
+            results.append(exc.with_traceback(None))
+
+    trees.clear()
+    return results
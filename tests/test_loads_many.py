@@ -0,0 +1,134 @@
+# Copyright 2025 Sreenath Somarajapuram
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+# tests/test_loads_many.py
+Tests for the `loads_many` function in the pyliteral module.
+This module tests parsing batches of Python literal expressions.
+"""
+
+import gc
+import weakref
+import pytest
+from pyliteral.core.exceptions import MaxSizeExceededError
+from pyliteral.loads import loads
+from pyliteral.loads_many import loads_many
+
+
+SAMPLES = [
+    '{"a": 1, "b": [2, 3], "c": None}',
+    '[1, 2, 3]',
+    '(1, 2, 3)',
+    '"hello"',
+    '42',
+    '3.14',
+    'True',
+    'None',
+]
+
+# --- Test cases for parsing batches ---
+
+def test_loads_many_matches_loads():
+    assert loads_many(SAMPLES) == [loads(s) for s in SAMPLES]
+
+
+def test_loads_many_empty_batch():
+    assert loads_many([]) == []
+
+
+def test_loads_many_generator():
+    result = loads_many(s for s in ['1', '2', '3'])
+    assert result == [1, 2, 3]
+
+
+def test_loads_many_with_vars():
+    result = loads_many(['x', '[x, y]', 'f"{x}-{y}"'], vars={"x": 1, "y": "b"})
+    assert result == [1, [1, "b"], "1-b"]
+
+
+def test_loads_many_repeated_strings_are_not_shared():
+    result = loads_many(['{"a": [1]}', '{"a": [1]}'])
+    assert result[0] == result[1]
+    assert result[0] is not result[1]
+    assert result[0]["a"] is not result[1]["a"]
+
+
+# --- Test error isolation ---
+
+def test_loads_many_isolates_errors():
+    result = loads_many(['1', 'invalid literal', '{1, 2}', 'x', '2'])
+    assert result[0] == 1
+    assert isinstance(result[1], SyntaxError)
+    assert isinstance(result[2], TypeError)
+    assert isinstance(result[3], NameError)
+    assert result[4] == 2
+
+
+def test_loads_many_isolates_input_errors():
+    result = loads_many(['', None, 123, ['1'], '[1, 2, 3]', '1'], max_size=5)
+    assert isinstance(result[0], ValueError)
+    assert isinstance(result[1], ValueError)
+    assert isinstance(result[2], TypeError)
+    assert isinstance(result[3], TypeError)
+    assert isinstance(result[4], MaxSizeExceededError)
+    assert result[5] == 1
+
+
+def test_loads_many_isolates_eval_errors():
+    result = loads_many(['{**x}', '1'], vars={"x": {}})
+    assert isinstance(result[0], ValueError)
+    assert result[1] == 1
+
+
+def test_loads_many_repeated_errors_are_not_shared():
+    result = loads_many(['x', 'x'])
+    assert isinstance(result[0], NameError)
+    assert isinstance(result[1], NameError)
+    assert result[0] is not result[1]
+
+
+def test_loads_many_errors_drop_traceback():
+    result = loads_many(['invalid literal', '1'])
+    assert isinstance(result[0], SyntaxError)
+    assert result[0].__traceback__ is None
+
+
+def test_loads_many_errors_do_not_keep_batch_alive():
+    class Batch(list):
+        pass
+
+    strings = Batch(['invalid literal', '[1, 2]', '[1, 2]', 'x'])
+    ref = weakref.ref(strings)
+
+    gc.disable()
+    try:
+        result = loads_many(strings)
+        del strings
+        assert ref() is None
+    finally:
+        gc.enable()
+
+    assert isinstance(result[0], SyntaxError)
+
+
+# --- Test error cases ---
+
+def test_err_loads_many_single_string():
+    with pytest.raises(TypeError):
+        loads_many('[1, 2, 3]')
+
+
+def test_err_loads_many_not_iterable():
+    with pytest.raises(TypeError):
+        loads_many(123)